@@ -8,7 +8,9 @@ Usage:
 
 Environment variables (all optional; sensible defaults provided):
   FEED_URLS            - comma-separated RSS feed URLs (overrides built-in list)
-  ALLOW_DOMAINS         - comma-separated domain allow-list (defaults included)
+  ALLOW_DOMAINS         - comma-separated domain allow-list (defaults included); a domain also
+                          covers its subdomains, and an entry without a dot (e.g. "ndtv")
+                          matches any domain containing it
   INCLUDE_KEYWORDS      - comma-separated keywords (article must match at least one if set)
   EXCLUDE_KEYWORDS      - comma-separated keywords to drop articles containing them
   MAX_ITEMS             - how many articles to include in each digest (default 10)
@@ -19,7 +21,9 @@ Environment variables (all optional; sensible defaults provided):
   SENDER_EMAIL          - gmail address to send from (required if DRY_RUN=false)
   RECEIVER_EMAIL        - recipient email (required if DRY_RUN=false)
   APP_PASSWORD          - Gmail App Password (required if DRY_RUN=false)
-  PERSIST_SENT          - "true" or "false" whether to persist sent urls in sent.json (default true)
+  PERSIST_SENT          - "true" or "false" whether to persist sent urls in sent.jsonl (default true)
+  FEEDS_META_FILE       - where feed ETag/Last-Modified values are kept for conditional GETs
+                          (default feeds_meta.json; set empty to always refetch feeds)
 
 Notes:
 - For Gmail SMTP: create an App Password (if account uses 2FA) and use it as APP_PASSWORD.
@@ -27,16 +31,29 @@ Notes:
 """
 
 import os
+import io
 import time
 import json
 import re
-from datetime import datetime
+import html
+import asyncio
+import heapq
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
-from typing import Optional, List, Set, Tuple
+from typing import Iterator, Optional, List, Set, Tuple, Dict
 
-import feedparser
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from bs4.dammit import UnicodeDammit
+from lxml import etree
 
 # Try import Gemini client; if not present we fallback
 try:
@@ -79,9 +96,18 @@ def get_env_list(name: str, default: Optional[List[str]] = None) -> List[str]:
 
 FEED_URLS = get_env_list("FEED_URLS", DEFAULT_FEEDS)
 ALLOW_DOMAINS = set(d.strip().lower() for d in os.environ.get("ALLOW_DOMAINS", "").split(",") if d.strip()) or DEFAULT_ALLOW_DOMAINS
+# dot-less entries are substring patterns, scanned only when the set lookups miss
+ALLOW_DOMAIN_PATTERNS = tuple(d for d in ALLOW_DOMAINS if "." not in d)
 INCLUDE_KEYWORDS = [k.strip().lower() for k in os.environ.get("INCLUDE_KEYWORDS", "").split(",") if k.strip()]
 EXCLUDE_KEYWORDS = [k.strip().lower() for k in os.environ.get("EXCLUDE_KEYWORDS", "").split(",") if k.strip()]
 
+def compile_keywords(keywords: List[str]) -> Optional["re.Pattern[str]"]:
+    # one alternation regex scans the text once instead of one `in` test per keyword
+    return re.compile("|".join(map(re.escape, keywords))) if keywords else None
+
+INCLUDE_RE = compile_keywords(INCLUDE_KEYWORDS)
+EXCLUDE_RE = compile_keywords(EXCLUDE_KEYWORDS)
+
 MAX_ITEMS = int(os.environ.get("MAX_ITEMS", "10"))
 MAX_PER_FEED = int(os.environ.get("MAX_PER_FEED", "25"))
 MIN_ARTICLE_LENGTH = int(os.environ.get("MIN_ARTICLE_LENGTH", "150"))
@@ -94,69 +120,233 @@ RECEIVER_EMAIL = os.environ.get("RECEIVER_EMAIL", "receiver@gmail.com").strip()
 APP_PASSWORD = os.environ.get("APP_PASSWORD", "xxxx xxxx xxxx xxxx").strip()
 
 PERSIST_SENT = os.environ.get("PERSIST_SENT", "true").lower() == "true"
-SENT_FILE = os.environ.get("SENT_FILE", "sent.json")
+SENT_FILE = os.environ.get("SENT_FILE", "sent.jsonl")
+LEGACY_SENT_FILE = "sent.json"  # pre-JSONL history: a single JSON array of urls
+FEEDS_META_FILE = os.environ.get("FEEDS_META_FILE", "feeds_meta.json").strip()
 
 REQUEST_TIMEOUT = 12
-SLEEP_BETWEEN_REQUESTS = 1.0
+FETCH_CONCURRENCY = 16      # article fetches in flight across all hosts
+PER_HOST_CONCURRENCY = 2    # politeness cap per publisher
+SUMMARY_CONCURRENCY = 4     # Gemini calls in flight (stay under rate limits)
+MAX_PAGE_BYTES = 512 * 1024  # stop reading an article page past this much (decompressed) HTML
+READ_CHUNK_SIZE = 64 * 1024
+FEED_CACHE_TTL = 300        # seconds a parsed feed is reused within one process
+USER_AGENT = "Mozilla/5.0 (compatible; IndiaDigest/1.0)"
+
+# shared keep-alive pool for the (threaded) feed downloads
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
 
 # -------------------- Helpers --------------------
+_NETLOC_RE = re.compile(r'^https?://(?:www\.)?([^/:?#@]+)(?=[/:?#]|$)', re.I)
+
 def domain_of(url: str) -> str:
+    # fast path for plain http(s) urls; urlparse only for the odd ones (userinfo, other schemes)
+    m = _NETLOC_RE.match(url)
+    if m:
+        return m.group(1).lower()
     try:
         return urlparse(url).netloc.lower().replace("www.", "")
     except Exception:
         return ""
 
+def domain_allowed(dom: str) -> bool:
+    # exact match or any parent domain (m.ndtv.com -> ndtv.com), all set lookups
+    if dom in ALLOW_DOMAINS:
+        return True
+    i = dom.find(".")
+    while i != -1:
+        if dom[i + 1:] in ALLOW_DOMAINS:
+            return True
+        i = dom.find(".", i + 1)
+    return any(pattern in dom for pattern in ALLOW_DOMAIN_PATTERNS)
+
+def _sent_source() -> Optional[str]:
+    # fall back to the legacy file until the first append migrates it
+    if os.path.exists(SENT_FILE):
+        return SENT_FILE
+    if os.path.exists(LEGACY_SENT_FILE):
+        return LEGACY_SENT_FILE
+    return None
+
+def _is_json_array(path: str) -> bool:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read(64).lstrip().startswith("[")
+
+def _read_sent_file(path: str) -> Set[str]:
+    if _is_json_array(path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return set(url for url in data if isinstance(url, str))
+    sent = set()
+    # one JSON-encoded url per line; skip lines torn by an interrupted append
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                url = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(url, str):
+                sent.add(url)
+    return sent
+
 def load_sent_set() -> Set[str]:
     if not PERSIST_SENT:
         return set()
-    if os.path.exists(SENT_FILE):
-        try:
-            with open(SENT_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return set(data if isinstance(data, list) else [])
-        except Exception:
-            return set()
-    return set()
-
-def save_sent_set(sent: Set[str]) -> None:
-    if not PERSIST_SENT:
+    src = _sent_source()
+    if src is None:
+        return set()
+    try:
+        return _read_sent_file(src)
+    except Exception:
+        return set()
+
+def migrate_sent_file() -> None:
+    """
+    One-time upgrade of a legacy JSON-array history (in SENT_FILE itself, or in
+    LEGACY_SENT_FILE while SENT_FILE doesn't exist yet) to JSONL at SENT_FILE.
+    """
+    src = _sent_source()
+    if src is None or not _is_json_array(src):
+        return
+    sent = _read_sent_file(src)
+    tmp = SENT_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(url) + "\n" for url in sorted(sent))
+    os.replace(tmp, SENT_FILE)
+
+def append_sent(urls: List[str]) -> None:
+    # append-only: cost depends on this batch, not on the size of the history
+    if not PERSIST_SENT or not urls:
+        return
+    try:
+        migrate_sent_file()
+        with open(SENT_FILE, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(url) + "\n" for url in urls)
+    except Exception as e:
+        print(f"[append_sent] could not write file: {e}")
+
+def load_feeds_meta() -> Dict[str, dict]:
+    if not FEEDS_META_FILE or not os.path.exists(FEEDS_META_FILE):
+        return {}
+    try:
+        with open(FEEDS_META_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def save_feeds_meta(meta: Dict[str, dict]) -> None:
+    # a dry run must not mark feeds as seen, or the next real run would get 304s
+    if not FEEDS_META_FILE or DRY_RUN:
         return
     try:
-        with open(SENT_FILE, "w", encoding="utf-8") as f:
-            json.dump(sorted(sent), f, indent=2)
+        with open(FEEDS_META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
     except Exception as e:
-        print(f"[save_sent_set] could not write file: {e}")
+        print(f"[save_feeds_meta] could not write file: {e}")
 
 # -------------------- Extraction --------------------
-def fetch_page(url: str) -> Tuple[Optional[str], Optional[str]]:
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+def _trim_partial_utf8(content: bytes) -> bytes:
+    # drop a multibyte UTF-8 character cut in half at the end of a truncated read;
+    # at worst this loses 3 trailing bytes of a page in another encoding
+    for i in range(1, min(4, len(content)) + 1):
+        b = content[-i]
+        if b & 0xC0 == 0x80:
+            continue  # continuation byte, keep looking for the lead byte
+        if b >= 0xC0:
+            width = 2 if b < 0xE0 else 3 if b < 0xF0 else 4
+            if width > i:
+                return content[:-i]
+        break
+    return content
+
+def extract_text(content: bytes, encoding: Optional[str] = None, truncated: bool = False) -> Optional[str]:
     """
-    Fetches page and returns (extracted_text_or_None, error_message_or_None).
+    Extracts article text from raw HTML bytes, or None if there is not enough of it.
+    encoding is the charset from the Content-Type header, if any; truncated says the
+    body was cut short (it may end mid-character).
     Uses <article> if present else <p> paragraphs. Limits text to ~6000 chars.
     """
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; IndiaDigest/1.0)"}
+    if truncated:
+        content = _trim_partial_utf8(content)
+    # lxml alone reads pages without <meta charset> as Latin-1, so pick the encoding
+    # up front: header charset if it decodes, else <meta>, else sniffed (utf-8 / cp1252)
+    dammit = UnicodeDammit(content, known_definite_encodings=[encoding] if encoding else [],
+                           is_html=True)
+    if dammit.unicode_markup is not None:
+        # reuse the decode; lxml refuses str input that still carries an XML encoding declaration
+        tree = lxml.html.fromstring(_XML_DECL_RE.sub("", dammit.unicode_markup, count=1))
+    else:
+        tree = lxml.html.fromstring(content)
+    paras = tree.xpath("(//article)[1]//p") or tree.xpath("//p")
+    # text_content() keeps inline tags (<a>, <b>, ...) glued to the surrounding words
+    text = " ".join(" ".join(p.text_content() for p in paras).split())
+    if not text or len(text) < MIN_ARTICLE_LENGTH:
+        return None  # not enough content (caller may use RSS summary)
+    return text[:6000]
+
+async def fetch_page_async(client: httpx.AsyncClient, url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Fetches page and returns (extracted_text_or_None, error_message_or_None).
+    """
     try:
-        r = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.content, "html.parser")
-        article_tag = soup.find("article")
-        if article_tag:
-            paras = article_tag.find_all("p")
-        else:
-            paras = soup.find_all("p")
-        text = " ".join(p.get_text().strip() for p in paras if p.get_text().strip())
-        if not text or len(text) < MIN_ARTICLE_LENGTH:
-            return None, None  # not enough content (caller may use RSS summary)
-        return text[:6000], None
-    except requests.exceptions.RequestException as e:
+        # stream so huge pages are cut off at MAX_PAGE_BYTES instead of fully buffered
+        async with client.stream("GET", url) as r:
+            r.raise_for_status()
+            content = bytearray()
+            truncated = False
+            async for chunk in r.aiter_bytes(READ_CHUNK_SIZE):
+                content += chunk
+                if len(content) >= MAX_PAGE_BYTES:
+                    truncated = True  # may end mid-character; extract_text trims the tail
+                    break
+        return extract_text(bytes(content), r.charset_encoding, truncated=truncated), None
+    except httpx.HTTPError as e:
         return None, f"fetch_error: {str(e)}"
     except Exception as e:
         return None, f"extract_error: {str(e)}"
 
+def new_http_client() -> httpx.AsyncClient:
+    # HTTP/2 lets requests to the same publisher share one multiplexed connection
+    limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    return httpx.AsyncClient(http2=True, limits=limits, timeout=REQUEST_TIMEOUT, follow_redirects=True,
+                             headers={"User-Agent": USER_AGENT})
+
+async def gather_all(client: httpx.AsyncClient, urls: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Fetches all urls concurrently over client (results in input order), bounded by
+    FETCH_CONCURRENCY overall and PER_HOST_CONCURRENCY per domain.
+    """
+    limit = asyncio.Semaphore(FETCH_CONCURRENCY)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def bounded(url: str):
+        host = host_limits.setdefault(domain_of(url), asyncio.Semaphore(PER_HOST_CONCURRENCY))
+        async with host, limit:
+            return await fetch_page_async(client, url)
+
+    return await asyncio.gather(*(bounded(url) for url in urls))
+
 # -------------------- Summarization --------------------
 _SENTENCE_SPLIT_RE = re.compile(r'(?<=[\.\?\!])\s+')
+_WS_RE = re.compile(r'\s+')
+_UNNORMALIZED_WS_RE = re.compile(r'[^\S ]| {2}')  # any \s other than a lone ASCII space
+
+def normalize_ws(text: str) -> str:
+    # already-clean text (e.g. from extract_text) skips the regex rewrite
+    if not _UNNORMALIZED_WS_RE.search(text):
+        return text.strip()
+    return _WS_RE.sub(' ', text).strip()
 
 def simple_extractive_summary(text: str, max_sentences: int = 3) -> str:
-    text = re.sub(r'\s+', ' ', (text or "")).strip()
+    text = normalize_ws(text or "")
     if not text:
         return ""
     sentences = _SENTENCE_SPLIT_RE.split(text)
@@ -166,19 +356,29 @@ def simple_extractive_summary(text: str, max_sentences: int = 3) -> str:
     bullets_txt = "\n".join(f"- {b.strip()}" for b in bullets) if bullets else ""
     return f"{headline.strip()}\n{bullets_txt}"
 
+_SUMMARY_PROMPT_PREFIX = "\n".join([
+    "You are a concise, factual summarizer. Output:",
+    "- One short headline (one line)",
+    "- Three clear bullet points (each 1 sentence)",
+    "",
+    "",
+])
+
+# Configure Gemini once per process and reuse the model handle for every summary
+_GEMINI_MODEL = None
+if GOOGLE_API_KEY and GEMINI_AVAILABLE:
+    try:
+        genai.configure(api_key=GOOGLE_API_KEY)
+        _GEMINI_MODEL = genai.GenerativeModel("gemini-1.5-flash-latest") #Or any model which you wish to keep
+    except Exception as e:
+        print(f"[summarize] Gemini setup failed: {e} — using extractive summaries.")
+
 def summarize(title: str, text: str) -> str:
     # Use Gemini if key present and client available
-    if GOOGLE_API_KEY and GEMINI_AVAILABLE:
+    if _GEMINI_MODEL is not None:
         try:
-            genai.configure(api_key=GOOGLE_API_KEY)
-            model = genai.GenerativeModel("gemini-1.5-flash-latest") #Or any model which you wish to keep
-            prompt = (
-                "You are a concise, factual summarizer. Output:\n"
-                "- One short headline (one line)\n"
-                "- Three clear bullet points (each 1 sentence)\n\n"
-                f"Article Title: {title}\n\nArticle Text:\n{text}\n\nSummary:"
-            )
-            resp = model.generate_content(prompt)
+            prompt = f"{_SUMMARY_PROMPT_PREFIX}Article Title: {title}\n\nArticle Text:\n{text}\n\nSummary:"
+            resp = _GEMINI_MODEL.generate_content(prompt)
             if hasattr(resp, "text") and resp.text:
                 return resp.text.strip()
             return str(resp)
@@ -189,6 +389,19 @@ def summarize(title: str, text: str) -> str:
         # No Gemini configured -> extractive fallback
         return simple_extractive_summary(text)
 
+async def summarize_all(items: List[dict]) -> List[str]:
+    """
+    Summarizes items' "text" concurrently on worker threads (results in input
+    order), with at most SUMMARY_CONCURRENCY calls in flight.
+    """
+    limit = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+
+    async def bounded(it: dict) -> str:
+        async with limit:
+            return await asyncio.to_thread(summarize, it["title"], it["text"])
+
+    return await asyncio.gather(*(bounded(it) for it in items))
+
 # -------------------- Filtering --------------------
 def passes_filters(entry, extracted_text: Optional[str]) -> Tuple[bool, str]:
     url = getattr(entry, "link", "") or ""
@@ -197,19 +410,19 @@ def passes_filters(entry, extracted_text: Optional[str]) -> Tuple[bool, str]:
     dom = domain_of(url)
 
     # 1) domain allowlist
-    if ALLOW_DOMAINS and not any(allow in dom for allow in ALLOW_DOMAINS):
+    if ALLOW_DOMAINS and not domain_allowed(dom):
         return False, f"domain_not_allowed:{dom}"
 
     # 2) exclude keywords
     combined = f"{title} {summary}"
-    for kw in EXCLUDE_KEYWORDS:
-        if kw and kw in combined:
-            return False, f"exclude_keyword:{kw}"
+    if EXCLUDE_RE:
+        m = EXCLUDE_RE.search(combined)
+        if m:
+            return False, f"exclude_keyword:{m.group(0)}"
 
     # 3) include keywords (if set -> at least one must match)
-    if INCLUDE_KEYWORDS:
-        if not any(kw in combined for kw in INCLUDE_KEYWORDS):
-            return False, "include_keywords_not_matched"
+    if INCLUDE_RE and not INCLUDE_RE.search(combined):
+        return False, "include_keywords_not_matched"
 
     # 4) length: prefer extracted_text if available, else summary
     effective_len = len(extracted_text or "") if extracted_text else len(summary or "")
@@ -218,72 +431,231 @@ def passes_filters(entry, extracted_text: Optional[str]) -> Tuple[bool, str]:
 
     return True, "ok"
 
-# -------------------- Collection & Digest --------------------
-def collect_and_summarize(max_items: int) -> List[dict]:
-    # load previous sent set
-    sent = load_sent_set()
-    candidates = []
-    now = datetime.utcnow()
-    for feed in FEED_URLS:
+# -------------------- Feeds --------------------
+@dataclass
+class FeedEntry:
+    link: str
+    title: str
+    summary: str
+    published: Optional[datetime]  # naive UTC, None if the feed gave no usable date
+
+@dataclass
+class ParsedFeed:
+    status: int
+    entries: List[FeedEntry] = field(default_factory=list)
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+def _child_text(elem, *names: str, deep: bool = False) -> str:
+    # deep: include nested markup, e.g. Atom <summary type="xhtml"><div>...</div></summary>
+    for name in names:
+        child = elem.find("{*}" + name)
+        if child is None:
+            continue
+        text = "".join(child.itertext()) if deep else child.text
+        if text and text.strip():
+            return text.strip()
+    return ""
+
+def _entry_link(elem) -> str:
+    # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+    for link in elem.iterfind("{*}link"):
+        if link.text and link.text.strip():
+            return link.text.strip()
+        if link.get("href") and link.get("rel", "alternate") == "alternate":
+            return link.get("href").strip()
+    # RSS items without <link>: a <guid> is a permalink unless isPermaLink="false"
+    guid = elem.find("{*}guid")
+    if guid is not None and guid.text and guid.get("isPermaLink", "true").strip().lower() != "false":
+        return guid.text.strip()
+    return ""
+
+def _parse_date(value: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)  # RSS (RFC 822)
+    except (TypeError, ValueError):
+        dt = None
+    if dt is None:
         try:
-            parsed = feedparser.parse(feed)
-            for e in parsed.entries[:MAX_PER_FEED]:
-                # determine published time (best-effort)
-                try:
-                    published = datetime(*e.published_parsed[:6])
-                except Exception:
-                    try:
-                        published = datetime(*e.updated_parsed[:6])
-                    except Exception:
-                        published = now
-                candidates.append((published, e))
-        except Exception as e:
-            print(f"[collect] feed parse error {feed}: {e}")
-
-    # newest first
-    candidates.sort(key=lambda x: x[0], reverse=True)
-
-    collected = []
-    for published, entry in candidates:
-        if len(collected) >= max_items:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))  # Atom (RFC 3339)
+        except ValueError:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+def parse_feed_fast(xml_bytes: bytes, limit: int) -> List[FeedEntry]:
+    """
+    Reads link/title/summary/published from the first `limit` RSS <item> or Atom
+    <entry> elements. Skips feedparser's sanitizing and clears each element once
+    read, so memory stays flat however long the feed is.
+    """
+    entries: List[FeedEntry] = []
+    if limit <= 0:
+        return entries
+    for _, elem in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag=("{*}item", "{*}entry"),
+                                   recover=True, resolve_entities=False, no_network=True):
+        summary = _child_text(elem, "description", "summary", "content", deep=True)
+        entries.append(FeedEntry(
+            link=_entry_link(elem),
+            title=html.unescape(_TAG_RE.sub("", _child_text(elem, "title"))),
+            summary=html.unescape(_TAG_RE.sub(" ", summary)).strip(),
+            published=_parse_date(_child_text(elem, "pubDate", "published", "updated", "date")),
+        ))
+        elem.clear()
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+        if len(entries) >= limit:
             break
-        url = getattr(entry, "link", "") or ""
-        title = getattr(entry, "title", url or "Untitled")
-        if not url:
-            continue
-        if url in sent:
-            # skip already sent
-            continue
+    return entries
 
-        print(f"[collect] trying: {title} ({url})")
-        extracted, err = fetch_page(url)
-        if not extracted:
-            # fallback to feed-provided summary/description
-            fallback = getattr(entry, "summary", None) or getattr(entry, "description", None)
-            if fallback:
-                print("[collect] using feed summary as fallback")
-                extracted = fallback
-            else:
-                print(f"[collect] skipped: could not fetch nor fallback for {url} ({err})")
-                continue
+def parse_feed(feed: str, meta: Optional[dict] = None) -> Optional[ParsedFeed]:
+    """
+    Fetches and parses one feed, returning None instead of raising so a bad feed can't sink the batch.
+    meta may carry the "etag"/"modified" of the last fetch to make the GET conditional.
+    """
+    meta = meta or {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("modified"):
+        headers["If-Modified-Since"] = meta["modified"]
+    try:
+        r = SESSION.get(feed, headers=headers, timeout=REQUEST_TIMEOUT)
+        if r.status_code == 304:
+            return ParsedFeed(status=304)
+        r.raise_for_status()
+        return ParsedFeed(status=r.status_code, entries=parse_feed_fast(r.content, MAX_PER_FEED),
+                          etag=r.headers.get("ETag"), modified=r.headers.get("Last-Modified"))
+    except Exception as e:
+        print(f"[collect] feed parse error {feed}: {e}")
+        return None
 
-        ok, reason = passes_filters(entry, extracted)
-        if not ok:
-            print(f"[collect] filtered out ({reason})")
-            continue
+# -------------------- Collection & Digest --------------------
+_FEED_CACHE: Dict[str, Tuple[float, ParsedFeed]] = {}
 
-        summary_txt = summarize(title, extracted)
-        collected.append({
-            "title": title,
-            "url": url,
-            "summary": summary_txt,
-            "published": published.isoformat()
-        })
-        # polite pause
-        time.sleep(SLEEP_BETWEEN_REQUESTS)
+def cached_parse(feed: str, meta: Optional[dict] = None, ttl: float = FEED_CACHE_TTL) -> Optional[ParsedFeed]:
+    """
+    parse_feed behind an in-process cache (for repeated main() calls in one process).
+    A result younger than ttl seconds is reused without a request; a 304 on an
+    older one revalidates and returns the cached copy.
+    """
+    hit = _FEED_CACHE.get(feed)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    parsed = parse_feed(feed, meta)
+    if parsed is None:
+        return None
+    if parsed.status == 304:
+        if not hit:
+            return parsed
+        parsed = hit[1]
+    if parsed.entries:
+        _FEED_CACHE[feed] = (time.monotonic(), parsed)
+    return parsed
+
+async def collect_articles(pending: Iterator[Tuple[datetime, FeedEntry]], max_items: int) -> List[dict]:
+    """
+    Fetches, filters and summarizes up to max_items articles from pending (newest
+    first), in batches over a single HTTP/2 client for the whole run.
+    """
+    collected = []
+    async with new_http_client() as client:
+        while len(collected) < max_items:
+            # fetch the next batch concurrently, oversampling to survive filter rejects
+            batch = list(islice(pending, (max_items - len(collected)) * 2))
+            if not batch:
+                break
+
+            for _, entry in batch:
+                print(f"[collect] trying: {entry.title or entry.link} ({entry.link})")
+            results = await gather_all(client, [entry.link for _, entry in batch])
+
+            for (published, entry), (extracted, err) in zip(batch, results):
+                if len(collected) >= max_items:
+                    break
+                url = entry.link
+                title = entry.title or url
+                if not extracted:
+                    # fallback to feed-provided summary/description
+                    fallback = getattr(entry, "summary", None) or getattr(entry, "description", None)
+                    if fallback:
+                        print(f"[collect] using feed summary as fallback for {url}")
+                        extracted = fallback
+                    else:
+                        print(f"[collect] skipped: could not fetch nor fallback for {url} ({err})")
+                        continue
+
+                ok, reason = passes_filters(entry, extracted)
+                if not ok:
+                    print(f"[collect] filtered out {url} ({reason})")
+                    continue
+
+                collected.append({
+                    "title": title,
+                    "url": url,
+                    "text": extracted,
+                    "published": published.isoformat()
+                })
+
+    # summaries are independent API round-trips, so overlap them
+    summaries = await summarize_all(collected)
+    for it, summary_txt in zip(collected, summaries):
+        del it["text"]
+        it["summary"] = summary_txt
 
     return collected
 
+def collect_and_summarize(max_items: int, feeds_meta: Optional[Dict[str, dict]] = None,
+                          sent: Optional[Set[str]] = None) -> List[dict]:
+    """
+    feeds_meta (see load_feeds_meta) is used for conditional feed GETs and
+    updated in place with the validators returned by each feed.
+    sent is the set of already-sent urls; loaded from SENT_FILE when omitted.
+    """
+    if sent is None:
+        sent = load_sent_set()
+    if feeds_meta is None:
+        feeds_meta = {}
+    per_feed: List[List[Tuple[datetime, FeedEntry]]] = []
+    now = datetime.utcnow()
+    # feeds are network-bound, so fetch them in parallel
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(FEED_URLS)))) as ex:
+        parsed_feeds = ex.map(lambda f: cached_parse(f, feeds_meta.get(f)), FEED_URLS)
+        for feed, parsed in zip(FEED_URLS, parsed_feeds):
+            if parsed is None:
+                continue
+            if parsed.status == 304:
+                print(f"[collect] feed unchanged since last run: {feed}")
+                continue
+            if parsed.etag or parsed.modified:
+                feeds_meta[feed] = {"etag": parsed.etag, "modified": parsed.modified}
+            # undated entries count as brand new (best-effort)
+            entries = [(e.published or now, e) for e in parsed.entries[:MAX_PER_FEED]]
+            # feeds are usually newest-first already, so this is near-free
+            entries.sort(key=itemgetter(0), reverse=True)
+            per_feed.append(entries)
+
+    # newest first: lazy k-way merge of the per-feed lists, consumed only as far as needed
+    merged = heapq.merge(*per_feed, key=itemgetter(0), reverse=True)
+
+    def unseen():
+        # drop link-less, already-sent and cross-feed duplicate entries before fetching anything
+        seen = set()
+        for published, entry in merged:
+            url = getattr(entry, "link", "") or ""
+            if not url or url in sent or url in seen:
+                continue
+            seen.add(url)
+            yield published, entry
+
+    return asyncio.run(collect_articles(unseen(), max_items))
+
 # -------------------- Email --------------------
 def compose_email_body(items: List[dict]) -> str:
     today = datetime.now().strftime("%B %d, %Y")
@@ -323,21 +695,22 @@ def main():
     sent_before = load_sent_set()
     print("Previously sent URLs:", len(sent_before))
 
-    items = collect_and_summarize(MAX_ITEMS)
+    feeds_meta = load_feeds_meta()
+    items = collect_and_summarize(MAX_ITEMS, feeds_meta, sent_before)
     if not items:
         print("[main] No items selected after filtering.")
+        save_feeds_meta(feeds_meta)
         return
     body = compose_email_body(items)
     subject = f"India Daily Top {len(items)} — {datetime.now().strftime('%Y-%m-%d')}"
     send_email(subject, body)
+    # only record feed validators once the digest built from them has gone out
+    save_feeds_meta(feeds_meta)
 
     # persist sent urls
     if PERSIST_SENT and not DRY_RUN:
-        sent = load_sent_set()
-        for it in items:
-            sent.add(it["url"])
-        save_sent_set(sent)
-        print("[main] Updated sent.json")
+        append_sent([it["url"] for it in items if it["url"] not in sent_before])
+        print(f"[main] Updated {SENT_FILE}")
 
 if __name__ == "__main__":
     main()
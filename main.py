@@ -1,7 +1,9 @@
 # --- All imports at the top ---
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import google.generativeai as genai
 import smtplib
 from email.message import EmailMessage
@@ -15,13 +17,23 @@ SENDER_EMAIL = "@gmail.com"  # Your Gmail address
 RECEIVER_EMAIL = "@gmail.com" # The email you want to send to
 APP_PASSWORD = "xxxx xxxx xxxx xxxx"
 
+# --- Shared HTTP session (keep-alive + retries on flaky gateways) ---
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                      max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])))
+
+# Only <p> tags are ever read, so don't build BS4 objects for anything else
+PARAGRAPHS_ONLY = SoupStrainer('p')
+
 # --- Helper function to get article text ---
 def get_article_text(url):
     try:
-        response = requests.get(url, timeout=10) # Added a timeout
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(url, timeout=10) # Added a timeout
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=PARAGRAPHS_ONLY)
         paragraphs = soup.find_all('p')
-        article_text = ' '.join([p.get_text() for p in paragraphs])
+        texts = (p.get_text().strip() for p in paragraphs)
+        article_text = ' '.join(t for t in texts if t)
         # A quick check to see if we got meaningful text
         if len(article_text) < 200:
             return None
@@ -0,0 +1,46 @@
+# Regression checks for article text extraction and feed parsing (run with pytest)
+import daily_digest_india_local as digest
+
+BODY = "₹500 crore — “quoted” नमस्ते भारत. " * 40
+
+
+def _page(body):
+    return f'<html><head><meta charset="utf-8"></head><body><article><p>{body}</p></article></body></html>'.encode()
+
+
+def test_utf8_without_meta_charset():
+    content = f"<html><body><p>{BODY}</p></body></html>".encode()
+    assert digest.extract_text(content).startswith("₹500 crore — “quoted” नमस्ते")
+
+
+def test_truncated_mid_character_utf8():
+    content = _page(BODY)
+    cut = content.index("नमस्ते".encode(), len(content) // 2) + 1  # inside a 3-byte character
+    text = digest.extract_text(content[:cut], "utf-8", truncated=True)
+    assert text is not None
+    assert text.startswith("₹500 crore — “quoted” नमस्ते भारत.")
+    assert "�" not in text
+
+
+def test_inline_tags_stay_glued():
+    content = _page("The <a href='#'>Supreme Court</a>, said <b>RBI</b>'s plan is multi<em>faceted</em>. " * 5)
+    assert digest.extract_text(content).startswith("The Supreme Court, said RBI's plan is multifaceted.")
+
+
+def test_rss_guid_permalink_used_as_link():
+    rss = b"""<rss><channel>
+    <item><title>A</title><guid>https://www.ndtv.com/a</guid></item>
+    <item><title>B</title><guid isPermaLink="false">tag:ndtv,b</guid></item>
+    <item><title>C</title><link>https://www.ndtv.com/c</link><guid>https://www.ndtv.com/c-guid</guid></item>
+    </channel></rss>"""
+    links = [e.link for e in digest.parse_feed_fast(rss, 10)]
+    assert links == ["https://www.ndtv.com/a", "", "https://www.ndtv.com/c"]
+
+
+def test_domain_allowlist_patterns(monkeypatch):
+    monkeypatch.setattr(digest, "ALLOW_DOMAINS", {"thehindu.com", "indiatimes"})
+    monkeypatch.setattr(digest, "ALLOW_DOMAIN_PATTERNS", ("indiatimes",))
+    assert digest.domain_allowed("thehindu.com")
+    assert digest.domain_allowed("m.thehindu.com")
+    assert digest.domain_allowed("economictimes.indiatimes.com")
+    assert not digest.domain_allowed("thehindu.com.example.net")